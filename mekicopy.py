@@ -1,22 +1,64 @@
+from __future__ import annotations
+
 import argparse
+import atexit
 import os
+import re
+import shutil
+import subprocess
 import sys
-import tempfile
+import threading
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from tkinter import messagebox, simpledialog
-from typing import Callable
+from functools import lru_cache
+from tkinter import messagebox
+from typing import TYPE_CHECKING, Callable, NamedTuple
 import traceback
 
-from PIL import Image
-import mss
+if TYPE_CHECKING:
+    import numpy as np
 
 EDGE_GRAB_PX = 8
 MIN_SIZE_PX = 10
+OCR_POLL_MS = 50
+DRAG_NEW, DRAG_MOVE, DRAG_LEFT, DRAG_RIGHT, DRAG_TOP, DRAG_BOTTOM = range(6)
+# Indexed by left<<3 | right<<2 | top<<1 | bottom edge hits; when several
+# edges are hit the first of left, right, top, bottom wins.
+_EDGE_LUT = (
+    None,  # 0b0000
+    DRAG_BOTTOM,  # 0b0001
+    DRAG_TOP,  # 0b0010
+    DRAG_TOP,  # 0b0011
+    DRAG_RIGHT,  # 0b0100
+    DRAG_RIGHT,  # 0b0101
+    DRAG_RIGHT,  # 0b0110
+    DRAG_RIGHT,  # 0b0111
+    DRAG_LEFT,  # 0b1000
+    DRAG_LEFT,  # 0b1001
+    DRAG_LEFT,  # 0b1010
+    DRAG_LEFT,  # 0b1011
+    DRAG_LEFT,  # 0b1100
+    DRAG_LEFT,  # 0b1101
+    DRAG_LEFT,  # 0b1110
+    DRAG_LEFT,  # 0b1111
+)
 _OCR_ENGINE = None
+_OCR_ENGINE_LOCK = threading.Lock()
+_OCR_RUN_LOCK = threading.Lock()
+_OCR_WARMUP_THREAD: threading.Thread | None = None
+_OCR_EXECUTOR: ThreadPoolExecutor | None = None
+_OCR_PROVIDER_PREFERENCE = (
+    "CUDAExecutionProvider",
+    "DmlExecutionProvider",
+    "CPUExecutionProvider",
+)
 _DLL_DIR_HANDLES = []
 _RUNTIME_PATH_READY = False
 _WINDOW_STREAM = None
+_SCT_LOCAL = threading.local()
+_GRAB_BACKEND = None
+_WS_RE = re.compile(r"\s+")
 
 
 def _get_app_dir() -> str:
@@ -77,9 +119,10 @@ def _prepare_windowed_streams() -> None:
 
 
 BOOKMARKS_FILE = os.path.join(_get_app_dir(), "bookmarks.txt")
+_BM_CACHE: dict = {"key": None, "data": {}}
 
 
-@dataclass
+@dataclass(slots=True)
 class Rect:
     left: int
     top: int
@@ -95,14 +138,19 @@ class Rect:
         return self.bottom - self.top
 
     def normalized(self) -> "Rect":
+        if self.left <= self.right and self.top <= self.bottom:
+            return self
         left = min(self.left, self.right)
         right = max(self.left, self.right)
         top = min(self.top, self.bottom)
         bottom = max(self.top, self.bottom)
         return Rect(left, top, right, bottom)
 
+    def coords(self) -> tuple[int, int, int, int]:
+        return self.left, self.top, self.right, self.bottom
+
 
-@dataclass
+@dataclass(slots=True)
 class Bookmark:
     name: str
     left: int
@@ -111,51 +159,71 @@ class Bookmark:
     height: int
 
 
-@dataclass
-class Region:
+class Region(NamedTuple):
     left: int
     top: int
     width: int
     height: int
 
 
+def _parse_bookmark_row(parts: list[bytes]) -> Bookmark:
+    name, left, top, width, height = parts
+    return Bookmark(name.decode("utf-8"), int(left), int(top), int(width), int(height))
+
+
 def load_bookmarks() -> dict[str, Bookmark]:
-    bookmarks: dict[str, Bookmark] = {}
-    if not os.path.exists(BOOKMARKS_FILE):
-        return bookmarks
-    with open(BOOKMARKS_FILE, "r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split("\t")
-            if len(parts) != 5:
-                continue
-            name, left, top, width, height = parts
+    try:
+        stat = os.stat(BOOKMARKS_FILE)
+    except OSError:
+        return {}
+    key = (BOOKMARKS_FILE, stat.st_mtime_ns, stat.st_size)
+    if _BM_CACHE["key"] == key:
+        return dict(_BM_CACHE["data"])
+
+    with open(BOOKMARKS_FILE, "rb") as handle:
+        lines = handle.read().splitlines()
+    rows = [parts for parts in (line.strip().split(b"\t") for line in lines) if len(parts) == 5]
+    try:
+        bookmarks = {bookmark.name: bookmark for bookmark in map(_parse_bookmark_row, rows)}
+    except ValueError:
+        bookmarks = {}
+        for parts in rows:
             try:
-                bookmarks[name] = Bookmark(
-                    name=name,
-                    left=int(left),
-                    top=int(top),
-                    width=int(width),
-                    height=int(height),
-                )
+                bookmark = _parse_bookmark_row(parts)
             except ValueError:
                 continue
-    return bookmarks
+            bookmarks[bookmark.name] = bookmark
+    _BM_CACHE["key"] = key
+    _BM_CACHE["data"] = bookmarks
+    return dict(bookmarks)
 
 
 def save_bookmarks(bookmarks: dict[str, Bookmark]) -> None:
-    with open(BOOKMARKS_FILE, "w", encoding="utf-8") as handle:
-        for name in sorted(bookmarks):
-            bookmark = bookmarks[name]
-            handle.write(
-                f"{bookmark.name}\t{bookmark.left}\t{bookmark.top}\t{bookmark.width}\t{bookmark.height}\n"
-            )
+    _BM_CACHE["key"] = None
+    data = "".join(
+        f"{bookmark.name}\t{bookmark.left}\t{bookmark.top}\t{bookmark.width}\t{bookmark.height}\n"
+        for bookmark in (bookmarks[name] for name in sorted(bookmarks))
+    )
+    temp_path = BOOKMARKS_FILE + ".tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            handle.write(data)
+        os.replace(temp_path, BOOKMARKS_FILE)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    if any(any(ch in name for ch in "\t\r\n") or name != name.strip() for name in bookmarks):
+        return
+    stat = os.stat(BOOKMARKS_FILE)
+    _BM_CACHE["key"] = (BOOKMARKS_FILE, stat.st_mtime_ns, stat.st_size)
+    _BM_CACHE["data"] = dict(bookmarks)
 
 
 def postprocess_text(text: str) -> str:
-    return " ".join(text.split())
+    return _WS_RE.sub(" ", text).strip()
 
 
 def _log_runtime_error(stage: str, exc: Exception) -> None:
@@ -215,34 +283,70 @@ def _patch_meikiocr_model_loader(meikiocr_ocr) -> None:
     meikiocr_ocr._mekicopy_patched = True
 
 
+def _select_ocr_provider() -> str:
+    try:
+        import onnxruntime as ort
+
+        available = ort.get_available_providers()
+    except Exception:
+        return "CPUExecutionProvider"
+    for provider in _OCR_PROVIDER_PREFERENCE:
+        if provider in available:
+            return provider
+    return "CPUExecutionProvider"
+
+
 def _get_ocr_engine():
     global _OCR_ENGINE
     if _OCR_ENGINE is not None:
         return _OCR_ENGINE
 
-    _prepare_windowed_streams()
-    _prepare_native_runtime_paths()
-    os.environ.setdefault("HF_HUB_DISABLE_PROGRESS_BARS", "1")
-    os.environ.setdefault("TQDM_DISABLE", "1")
-    os.environ.setdefault("KMP_DUPLICATE_LIB_OK", "TRUE")
-    _patch_onnxruntime_compat()
-    import meikiocr.ocr as meikiocr_ocr
+    with _OCR_ENGINE_LOCK:
+        if _OCR_ENGINE is not None:
+            return _OCR_ENGINE
 
-    _patch_meikiocr_model_loader(meikiocr_ocr)
-    _OCR_ENGINE = meikiocr_ocr.MeikiOCR(provider="CPUExecutionProvider")
+        _prepare_windowed_streams()
+        _prepare_native_runtime_paths()
+        os.environ.setdefault("HF_HUB_DISABLE_PROGRESS_BARS", "1")
+        os.environ.setdefault("TQDM_DISABLE", "1")
+        os.environ.setdefault("KMP_DUPLICATE_LIB_OK", "TRUE")
+        _patch_onnxruntime_compat()
+        import meikiocr.ocr as meikiocr_ocr
+
+        _patch_meikiocr_model_loader(meikiocr_ocr)
+        _OCR_ENGINE = meikiocr_ocr.MeikiOCR(provider=_select_ocr_provider())
     return _OCR_ENGINE
 
 
-def run_meikiocr(image_path: str) -> str:
+def _warm_up_ocr_engine() -> None:
+    try:
+        _prepare_native_runtime_paths()
+        import numpy as np
+
+        ocr = _get_ocr_engine()
+        with _OCR_RUN_LOCK:
+            ocr.run_ocr(np.zeros((MIN_SIZE_PX, MIN_SIZE_PX, 3), dtype=np.uint8))
+    except Exception as exc:
+        _log_runtime_error("warm_up_ocr_engine", exc)
+
+
+def start_ocr_warmup() -> None:
+    global _OCR_WARMUP_THREAD
+    if _OCR_ENGINE is not None or _OCR_WARMUP_THREAD is not None:
+        return
+    _OCR_WARMUP_THREAD = threading.Thread(target=_warm_up_ocr_engine, daemon=True)
+    _OCR_WARMUP_THREAD.start()
+
+
+def run_meikiocr(image: np.ndarray) -> str:
     try:
         _prepare_native_runtime_paths()
         import cv2
 
         ocr = _get_ocr_engine()
-        image = cv2.imread(image_path, cv2.IMREAD_COLOR)
-        if image is None:
-            return ""
-        results = ocr.run_ocr(image)
+        bgr_image = cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
+        with _OCR_RUN_LOCK:
+            results = ocr.run_ocr(bgr_image)
     except Exception as exc:
         _log_runtime_error("run_meikiocr", exc)
         return postprocess_text(str(exc))
@@ -255,42 +359,261 @@ def run_meikiocr(image_path: str) -> str:
     return postprocess_text("\n".join(output_lines))
 
 
-def capture_region(left: int, top: int, width: int, height: int) -> Image.Image:
+def _sct_singleton():
+    sct = getattr(_SCT_LOCAL, "sct", None)
+    if sct is None:
+        import mss
+
+        sct = mss.mss()
+        atexit.register(sct.close)
+        _SCT_LOCAL.sct = sct
+    return sct
+
+
+@lru_cache(maxsize=1)
+def _virtual_monitor() -> tuple[int, int, int, int]:
+    import mss
+
     with mss.mss() as sct:
-        region = {"left": left, "top": top, "width": width, "height": height}
-        sct_image = sct.grab(region)
-        return Image.frombytes("RGB", sct_image.size, sct_image.rgb)
-
-
-def copy_text_to_clipboard(text: str) -> None:
-    clip = tk.Tk()
-    clip.withdraw()
-    clip.clipboard_clear()
-    clip.clipboard_append(text)
-    clip.update()
-    clip.destroy()
-    messagebox.showinfo("MekiCopy", "복사되었습니다!")
+        monitor = sct.monitors[0]
+    return monitor["left"], monitor["top"], monitor["width"], monitor["height"]
+
+
+def _mss_grab(left: int, top: int, width: int, height: int) -> np.ndarray:
+    import numpy as np
+
+    sct = _sct_singleton()
+    region = {"left": left, "top": top, "width": width, "height": height}
+    sct_image = sct.grab(region)
+    return np.frombuffer(sct_image.raw, dtype=np.uint8).reshape(
+        sct_image.height, sct_image.width, 4
+    )
+
+
+def _make_dxcam_grab(camera) -> Callable[[int, int, int, int], np.ndarray]:
+    def _dxcam_grab(left: int, top: int, width: int, height: int) -> np.ndarray:
+        if left < 0 or top < 0 or left + width > camera.width or top + height > camera.height:
+            return _mss_grab(left, top, width, height)
+        try:
+            frame = camera.grab(region=(left, top, left + width, top + height))
+        except Exception:
+            frame = None
+        if frame is None:
+            return _mss_grab(left, top, width, height)
+        return frame
+
+    return _dxcam_grab
 
 
-def ocr_and_copy(left: int, top: int, width: int, height: int) -> None:
+def _make_grab_backend() -> Callable[[int, int, int, int], np.ndarray]:
+    if sys.platform == "win32":
+        try:
+            import dxcam
+
+            camera = dxcam.create(output_color="BGRA")
+        except Exception:
+            camera = None
+        if camera is not None:
+            return _make_dxcam_grab(camera)
+    return _mss_grab
+
+
+def _get_grab_backend() -> Callable[[int, int, int, int], np.ndarray]:
+    global _GRAB_BACKEND
+    if _GRAB_BACKEND is None:
+        _GRAB_BACKEND = _make_grab_backend()
+    return _GRAB_BACKEND
+
+
+def capture_region_bgra(left: int, top: int, width: int, height: int) -> np.ndarray:
+    return _get_grab_backend()(left, top, width, height)
+
+
+def _check_capture_size(width: int, height: int) -> bool:
     if width < MIN_SIZE_PX or height < MIN_SIZE_PX:
         messagebox.showerror("MekiCopy", "캡처 영역이 너무 작습니다.")
-        return
-    image = capture_region(left, top, width, height)
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp_file:
-        temp_path = temp_file.name
-        image.save(temp_path)
+        return False
+    return True
+
+
+def copy_text_to_clipboard(text: str, root: tk.Misc | None = None) -> None:
+    if root is not None:
+        root.clipboard_clear()
+        root.clipboard_append(text)
+        root.update_idletasks()
+    else:
+        clip = tk.Tk()
+        clip.withdraw()
+        clip.clipboard_clear()
+        clip.clipboard_append(text)
+        clip.update()
+        clip.destroy()
+    messagebox.showinfo("MekiCopy", "복사되었습니다!")
+
+
+def _set_windows_clipboard(text: str) -> bool:
+    import ctypes
+    from ctypes import wintypes
+
+    cf_unicodetext = 13
+    gmem_moveable = 0x0002
+    hwnd_message = wintypes.HWND(-3)
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    user32.CreateWindowExW.argtypes = [
+        wintypes.DWORD,
+        wintypes.LPCWSTR,
+        wintypes.LPCWSTR,
+        wintypes.DWORD,
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_int,
+        wintypes.HWND,
+        wintypes.HMENU,
+        wintypes.HINSTANCE,
+        wintypes.LPVOID,
+    ]
+    user32.CreateWindowExW.restype = wintypes.HWND
+    user32.DestroyWindow.argtypes = [wintypes.HWND]
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.OpenClipboard.restype = wintypes.BOOL
+    user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = ctypes.c_void_p
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+
+    data = text.encode("utf-16-le") + b"\x00\x00"
+    handle = kernel32.GlobalAlloc(gmem_moveable, len(data))
+    if not handle:
+        return False
+    pointer = kernel32.GlobalLock(handle)
+    if not pointer:
+        kernel32.GlobalFree(handle)
+        return False
+    ctypes.memmove(pointer, data, len(data))
+    kernel32.GlobalUnlock(handle)
+
+    # EmptyClipboard assigns ownership to the window passed to OpenClipboard;
+    # with no window SetClipboardData fails, so use a hidden message-only one.
+    hwnd = user32.CreateWindowExW(0, "STATIC", None, 0, 0, 0, 0, 0, hwnd_message, None, None, None)
+    if not hwnd:
+        kernel32.GlobalFree(handle)
+        return False
     try:
-        text = run_meikiocr(temp_path)
-    finally:
+        if not user32.OpenClipboard(hwnd):
+            kernel32.GlobalFree(handle)
+            return False
         try:
-            os.remove(temp_path)
-        except OSError:
-            pass
-    copy_text_to_clipboard(text)
+            user32.EmptyClipboard()
+            if not user32.SetClipboardData(cf_unicodetext, handle):
+                kernel32.GlobalFree(handle)
+                return False
+            return True
+        finally:
+            user32.CloseClipboard()
+    finally:
+        user32.DestroyWindow(hwnd)
+
+
+def _clipboard_command() -> list[str] | None:
+    if sys.platform == "darwin":
+        return ["pbcopy"]
+    if os.environ.get("WAYLAND_DISPLAY") and shutil.which("wl-copy"):
+        return ["wl-copy"]
+    if shutil.which("xclip"):
+        return ["xclip", "-selection", "clipboard"]
+    if shutil.which("xsel"):
+        return ["xsel", "--clipboard", "--input"]
+    return None
+
+
+def set_native_clipboard(text: str) -> bool:
+    try:
+        if sys.platform == "win32":
+            return _set_windows_clipboard(text)
+        command = _clipboard_command()
+        if command is None:
+            return False
+        subprocess.run(command, input=text.encode("utf-8"), check=True)
+        return True
+    except (OSError, subprocess.SubprocessError) as exc:
+        _log_runtime_error("set_native_clipboard", exc)
+        return False
+
+
+def run_bookmark_headless(bookmark: Bookmark) -> None:
+    if not _check_capture_size(bookmark.width, bookmark.height):
+        return
+    image = capture_region_bgra(bookmark.left, bookmark.top, bookmark.width, bookmark.height)
+    text = run_meikiocr(image)
+    if not set_native_clipboard(text):
+        copy_text_to_clipboard(text)
+
+
+def ocr_and_copy(
+    left: int,
+    top: int,
+    width: int,
+    height: int,
+    root: tk.Misc | None = None,
+) -> None:
+    if not _check_capture_size(width, height):
+        return
+    image = capture_region_bgra(left, top, width, height)
+    text = run_meikiocr(image)
+    copy_text_to_clipboard(text, root)
+
+
+def _get_ocr_executor() -> ThreadPoolExecutor:
+    global _OCR_EXECUTOR
+    if _OCR_EXECUTOR is None:
+        _OCR_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mekicopy-ocr")
+    return _OCR_EXECUTOR
+
+
+def ocr_and_copy_async(root: tk.Misc, left: int, top: int, width: int, height: int) -> None:
+    if not _check_capture_size(width, height):
+        return
+    image = capture_region_bgra(left, top, width, height)
+    future = _get_ocr_executor().submit(run_meikiocr, image)
+    root.after(OCR_POLL_MS, _poll_ocr_future, root, future)
+
+
+def _poll_ocr_future(root: tk.Misc, future: Future) -> None:
+    if not future.done():
+        root.after(OCR_POLL_MS, _poll_ocr_future, root, future)
+        return
+    copy_text_to_clipboard(future.result(), root)
 
 
 class SelectionUI:
+    __slots__ = (
+        "root",
+        "canvas",
+        "rect_id",
+        "handle_ids",
+        "start_point",
+        "selection",
+        "drag_mode",
+        "initial_rect",
+        "bookmarks",
+        "on_confirm",
+        "capture_on_enter",
+        "virtual_left",
+        "virtual_top",
+        "virtual_width",
+        "virtual_height",
+        "_redraw_after_id",
+        "_norm",
+        "_last_draw_key",
+        "_drag_handlers",
+    )
+
     def __init__(
         self,
         root: tk.Tk,
@@ -304,18 +627,29 @@ class SelectionUI:
         self.handle_ids: dict[str, int] = {}
         self.start_point: tuple[int, int] | None = None
         self.selection: Rect | None = None
-        self.drag_mode: str | None = None
+        self.drag_mode: int | None = None
         self.initial_rect = initial_rect
         self.bookmarks = load_bookmarks()
         self.on_confirm = on_confirm
         self.capture_on_enter = capture_on_enter
+        self._redraw_after_id: str | None = None
+        self._norm: tuple[int, int, int, int] = (0, 0, 0, 0)
+        self._last_draw_key: tuple[int, int, int, int] | None = None
+        self._drag_handlers = (
+            self._drag_new,
+            self._drag_move,
+            self._drag_left,
+            self._drag_right,
+            self._drag_top,
+            self._drag_bottom,
+        )
 
-        with mss.mss() as sct:
-            monitor = sct.monitors[0]
-        self.virtual_left = monitor["left"]
-        self.virtual_top = monitor["top"]
-        self.virtual_width = monitor["width"]
-        self.virtual_height = monitor["height"]
+        (
+            self.virtual_left,
+            self.virtual_top,
+            self.virtual_width,
+            self.virtual_height,
+        ) = _virtual_monitor()
 
         self._setup_root()
         self._setup_canvas()
@@ -345,6 +679,25 @@ class SelectionUI:
             height=self.virtual_height,
         )
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.rect_id = self.canvas.create_rectangle(
+            0,
+            0,
+            0,
+            0,
+            outline="yellow",
+            width=2,
+            state="hidden",
+        )
+        for name in ("left", "right", "top", "bottom"):
+            self.handle_ids[name] = self.canvas.create_rectangle(
+                0,
+                0,
+                0,
+                0,
+                outline="yellow",
+                fill="black",
+                state="hidden",
+            )
 
     def _bind_events(self) -> None:
         self.canvas.bind("<ButtonPress-1>", self._on_mouse_down)
@@ -374,12 +727,6 @@ class SelectionUI:
             font=("Segoe UI", 12, "bold"),
         )
 
-    def _canvas_coords(self, x: int, y: int) -> tuple[int, int]:
-        return x - self.virtual_left, y - self.virtual_top
-
-    def _screen_coords(self, x: int, y: int) -> tuple[int, int]:
-        return x + self.virtual_left, y + self.virtual_top
-
     def _set_selection(self, rect: Rect) -> None:
         rect = rect.normalized()
         self.selection = rect
@@ -388,95 +735,97 @@ class SelectionUI:
     def _draw_selection(self) -> None:
         if not self.selection:
             return
+        self._last_draw_key = self.selection.coords()
         rect = self.selection.normalized()
-        if self.rect_id:
-            self.canvas.delete(self.rect_id)
-        for handle_id in self.handle_ids.values():
-            self.canvas.delete(handle_id)
-        self.rect_id = self.canvas.create_rectangle(
-            rect.left,
-            rect.top,
-            rect.right,
-            rect.bottom,
-            outline="yellow",
-            width=2,
-        )
-        self.handle_ids = {}
+        self._norm = rect.coords()
+        self.canvas.coords(self.rect_id, *self._norm)
+        self.canvas.itemconfigure(self.rect_id, state="normal")
         self._draw_handles(rect)
 
     def _draw_handles(self, rect: Rect) -> None:
         cx = (rect.left + rect.right) // 2
         cy = (rect.top + rect.bottom) // 2
-        self.handle_ids["left"] = self._draw_handle(rect.left, cy)
-        self.handle_ids["right"] = self._draw_handle(rect.right, cy)
-        self.handle_ids["top"] = self._draw_handle(cx, rect.top)
-        self.handle_ids["bottom"] = self._draw_handle(cx, rect.bottom)
+        self._draw_handle(self.handle_ids["left"], rect.left, cy)
+        self._draw_handle(self.handle_ids["right"], rect.right, cy)
+        self._draw_handle(self.handle_ids["top"], cx, rect.top)
+        self._draw_handle(self.handle_ids["bottom"], cx, rect.bottom)
 
-    def _draw_handle(self, x: int, y: int) -> int:
+    def _draw_handle(self, handle_id: int, x: int, y: int) -> None:
         size = 6
-        return self.canvas.create_rectangle(
-            x - size,
-            y - size,
-            x + size,
-            y + size,
-            outline="yellow",
-            fill="black",
-        )
+        self.canvas.coords(handle_id, x - size, y - size, x + size, y + size)
+        self.canvas.itemconfigure(handle_id, state="normal")
 
-    def _edge_hit_test(self, x: int, y: int) -> str | None:
+    def _hide_selection(self) -> None:
+        self._last_draw_key = None
+        self.canvas.itemconfigure(self.rect_id, state="hidden")
+        for handle_id in self.handle_ids.values():
+            self.canvas.itemconfigure(handle_id, state="hidden")
+
+    def _edge_hit_test(self, x: int, y: int) -> int | None:
         if not self.selection:
             return None
-        rect = self.selection.normalized()
-        if abs(x - rect.left) <= EDGE_GRAB_PX and rect.top <= y <= rect.bottom:
-            return "left"
-        if abs(x - rect.right) <= EDGE_GRAB_PX and rect.top <= y <= rect.bottom:
-            return "right"
-        if abs(y - rect.top) <= EDGE_GRAB_PX and rect.left <= x <= rect.right:
-            return "top"
-        if abs(y - rect.bottom) <= EDGE_GRAB_PX and rect.left <= x <= rect.right:
-            return "bottom"
-        if rect.left <= x <= rect.right and rect.top <= y <= rect.bottom:
-            return "move"
-        return None
+        left, top, right, bottom = self._norm
+        inside_x = left <= x <= right
+        inside_y = top <= y <= bottom
+        flags = (
+            (abs(x - left) <= EDGE_GRAB_PX and inside_y) << 3
+            | (abs(x - right) <= EDGE_GRAB_PX and inside_y) << 2
+            | (abs(y - top) <= EDGE_GRAB_PX and inside_x) << 1
+            | (abs(y - bottom) <= EDGE_GRAB_PX and inside_x)
+        )
+        if flags:
+            return _EDGE_LUT[flags]
+        return DRAG_MOVE if inside_x and inside_y else None
 
     def _on_mouse_down(self, event: tk.Event) -> None:
         x, y = event.x, event.y
         if self.selection:
             hit = self._edge_hit_test(x, y)
-            if hit:
+            if hit is not None:
                 self.drag_mode = hit
                 self.start_point = (x, y)
                 return
-        self.drag_mode = "new"
+        self.drag_mode = DRAG_NEW
         self.start_point = (x, y)
         self.selection = Rect(x, y, x, y)
         self._draw_selection()
 
     def _on_mouse_drag(self, event: tk.Event) -> None:
-        if not self.start_point or not self.selection:
+        if not self.start_point or not self.selection or self.drag_mode is None:
             return
-        x, y = event.x, event.y
-        rect = self.selection
-        if self.drag_mode == "new":
-            rect.right = x
-            rect.bottom = y
-        elif self.drag_mode == "move":
-            dx = x - self.start_point[0]
-            dy = y - self.start_point[1]
-            rect.left += dx
-            rect.right += dx
-            rect.top += dy
-            rect.bottom += dy
-            self.start_point = (x, y)
-        elif self.drag_mode == "left":
-            rect.left = x
-        elif self.drag_mode == "right":
-            rect.right = x
-        elif self.drag_mode == "top":
-            rect.top = y
-        elif self.drag_mode == "bottom":
-            rect.bottom = y
-        self.selection = rect
+        self._drag_handlers[self.drag_mode](self.selection, event.x, event.y)
+        if self.selection.coords() == self._last_draw_key:
+            return
+        if self._redraw_after_id is None:
+            self._redraw_after_id = self.canvas.after_idle(self._flush_redraw)
+
+    def _drag_new(self, rect: Rect, x: int, y: int) -> None:
+        rect.right = x
+        rect.bottom = y
+
+    def _drag_move(self, rect: Rect, x: int, y: int) -> None:
+        dx = x - self.start_point[0]
+        dy = y - self.start_point[1]
+        rect.left += dx
+        rect.right += dx
+        rect.top += dy
+        rect.bottom += dy
+        self.start_point = (x, y)
+
+    def _drag_left(self, rect: Rect, x: int, y: int) -> None:
+        rect.left = x
+
+    def _drag_right(self, rect: Rect, x: int, y: int) -> None:
+        rect.right = x
+
+    def _drag_top(self, rect: Rect, x: int, y: int) -> None:
+        rect.top = y
+
+    def _drag_bottom(self, rect: Rect, x: int, y: int) -> None:
+        rect.bottom = y
+
+    def _flush_redraw(self) -> None:
+        self._redraw_after_id = None
         self._draw_selection()
 
     def _on_mouse_up(self, event: tk.Event) -> None:
@@ -485,8 +834,7 @@ class SelectionUI:
         rect = self.selection.normalized()
         if rect.width < MIN_SIZE_PX or rect.height < MIN_SIZE_PX:
             self.selection = None
-            if self.rect_id:
-                self.canvas.delete(self.rect_id)
+            self._hide_selection()
             return
         self.selection = rect
         self.drag_mode = None
@@ -496,37 +844,50 @@ class SelectionUI:
     def _on_capture(self, event: tk.Event | None = None) -> None:
         if not self.selection:
             return
-        rect = self.selection.normalized()
-        left, top = self._screen_coords(rect.left, rect.top)
-        width = rect.width
-        height = rect.height
+        region = self._selection_region()
         if self.capture_on_enter:
             self.root.withdraw()
             self.root.update_idletasks()
-            ocr_and_copy(left, top, width, height)
+            ocr_and_copy(region.left, region.top, region.width, region.height)
         elif self.on_confirm:
-            self.on_confirm(Region(left=left, top=top, width=width, height=height))
-        self.root.destroy()
+            self.on_confirm(region)
+        self._close()
+
+    def _selection_region(self) -> Region:
+        rect = self.selection.normalized()
+        return Region(
+            left=rect.left + self.virtual_left,
+            top=rect.top + self.virtual_top,
+            width=rect.right - rect.left,
+            height=rect.bottom - rect.top,
+        )
 
     def _on_save_bookmark(self, event: tk.Event | None = None) -> None:
         if not self.selection:
             return
+        from tkinter import simpledialog
+
         name = simpledialog.askstring("MekiCopy", "북마크 이름을 입력하세요")
         if not name:
             return
-        rect = self.selection.normalized()
-        left, top = self._screen_coords(rect.left, rect.top)
+        region = self._selection_region()
         self.bookmarks[name] = Bookmark(
             name=name,
-            left=left,
-            top=top,
-            width=rect.width,
-            height=rect.height,
+            left=region.left,
+            top=region.top,
+            width=region.width,
+            height=region.height,
         )
         save_bookmarks(self.bookmarks)
         messagebox.showinfo("MekiCopy", "북마크가 저장되었습니다!")
 
     def _on_cancel(self, event: tk.Event | None = None) -> None:
+        self._close()
+
+    def _close(self) -> None:
+        if self._redraw_after_id is not None:
+            self.canvas.after_cancel(self._redraw_after_id)
+            self._redraw_after_id = None
         self.root.destroy()
 
 
@@ -588,10 +949,7 @@ def build_initial_rect(region: Region | Bookmark | None) -> Rect | None:
     rect_top = region.top
     rect_right = rect_left + region.width
     rect_bottom = rect_top + region.height
-    with mss.mss() as sct:
-        monitor = sct.monitors[0]
-    left_offset = monitor["left"]
-    top_offset = monitor["top"]
+    left_offset, top_offset, _width, _height = _virtual_monitor()
     return Rect(
         rect_left - left_offset,
         rect_top - top_offset,
@@ -605,6 +963,8 @@ def run_selection(
     capture_on_enter: bool = True,
     parent: tk.Tk | None = None,
 ) -> Region | None:
+    if capture_on_enter:
+        start_ocr_warmup()
     selection: Region | None = None
 
     def store_selection(region: Region) -> None:
@@ -638,6 +998,8 @@ class MainWindow(tk.Tk):
         self.draft_region: Region | None = None
         self.active_region: Region | None = None
         self._build_ui()
+        self.bind("<Configure>", self._on_configure)
+        start_ocr_warmup()
 
     def _build_ui(self) -> None:
         header = tk.Label(self, text="MekiCopy 빠른 실행", font=("Segoe UI", 12, "bold"))
@@ -661,6 +1023,10 @@ class MainWindow(tk.Tk):
 
         self._update_status()
 
+    def _on_configure(self, event: tk.Event) -> None:
+        if event.widget is self:
+            _virtual_monitor.cache_clear()
+
     def _format_region(self, region: Region | None) -> str:
         if not region:
             return "설정되지 않음"
@@ -669,9 +1035,9 @@ class MainWindow(tk.Tk):
     def _update_status(self) -> None:
         draft_text = self._format_region(self.draft_region)
         active_text = self._format_region(self.active_region)
-        self.status_label.config(
-            text=f"현재 영역(임시): {draft_text}\n설정된 영역: {active_text}"
-        )
+        text = f"현재 영역(임시): {draft_text}\n설정된 영역: {active_text}"
+        if self.status_label.cget("text") != text:
+            self.status_label.config(text=text)
 
     def _on_select_region(self) -> None:
         initial = self.draft_region or self.active_region
@@ -700,12 +1066,7 @@ class MainWindow(tk.Tk):
         if not self.draft_region:
             messagebox.showerror("MekiCopy", "먼저 영역을 지정하거나 북마크를 불러오세요.")
             return
-        self.active_region = Region(
-            left=self.draft_region.left,
-            top=self.draft_region.top,
-            width=self.draft_region.width,
-            height=self.draft_region.height,
-        )
+        self.active_region = self.draft_region
         self._update_status()
         messagebox.showinfo("MekiCopy", "인식 영역이 설정되었습니다!")
 
@@ -713,7 +1074,8 @@ class MainWindow(tk.Tk):
         if not self.active_region:
             messagebox.showerror("MekiCopy", "설정된 영역이 없습니다.")
             return
-        ocr_and_copy(
+        ocr_and_copy_async(
+            self,
             self.active_region.left,
             self.active_region.top,
             self.active_region.width,
@@ -737,7 +1099,7 @@ def main() -> None:
         if not bookmark:
             messagebox.showerror("MekiCopy", "북마크를 찾을 수 없습니다.")
             return
-        ocr_and_copy(bookmark.left, bookmark.top, bookmark.width, bookmark.height)
+        run_bookmark_headless(bookmark)
         return
     if args.pick_bookmark:
         run_picker_and_capture()